@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import shlex
 import shutil
+from collections import deque
 from collections.abc import Mapping
 from colorsys import hsv_to_rgb
-from functools import cached_property
+from dataclasses import dataclass
+from functools import cache, cached_property
 from pathlib import Path
 from random import random
 from textwrap import dedent
 from typing import Annotated, Union
 
 from identify.identify import tags_from_path
-from jinja2 import Environment
+from jinja2 import Environment, Template
 from networkx import DiGraph
 from pydantic import Field, field_validator
+from pydantic_core import to_json
 from rich.color import Color
 from typing_extensions import assert_never
 
@@ -47,6 +50,13 @@ def random_color() -> str:
 template_environment = Environment()
 
 
+@cache
+def compile_template(source: str) -> Template:
+    # from_string() doesn't use the environment's template cache,
+    # so without this every render would recompile the template
+    return template_environment.from_string(source)
+
+
 class Target(Model):
     commands: Annotated[str, Field(description="The commands to run for this target.")] = ""
     args: Annotated[
@@ -71,16 +81,20 @@ class Target(Model):
     def dedent_commands(cls, commands: str) -> str:
         return dedent(commands).strip()
 
-    def render(self, args: Args) -> str:
+    @cached_property
+    def shebang(self) -> str:
         exe, *exe_args = shlex.split(self.executable)
         which_exe = shutil.which(exe)
         if which_exe is None:
             raise Exception(f"Failed to find absolute path to executable for {exe}")
 
-        template = template_environment.from_string(
+        return f"#!{shlex.join((which_exe, *exe_args))}"
+
+    def render(self, args: Args) -> str:
+        template = compile_template(
             "\n".join(
                 (
-                    f"#!{shlex.join((which_exe, *exe_args))}",
+                    self.shebang,
                     "",
                     self.commands,
                 )
@@ -154,7 +168,7 @@ class ResolvedNode(Model):
 
     @cached_property
     def uid(self) -> str:
-        return md5(self.model_dump_json(exclude={"color"}).encode())
+        return md5(to_json(self, exclude={"color"}))
 
 
 class Node(Model):
@@ -208,6 +222,51 @@ class Node(Model):
         )
 
 
+@dataclass(frozen=True)
+class FlowTopology:
+    # nodes are identified by their position in the flow,
+    # and the graph is stored as adjacency lists of those positions
+    index: Mapping[str, int]
+    nodes: tuple[ResolvedNode, ...]
+    successors: tuple[tuple[int, ...], ...]
+    predecessors: tuple[tuple[int, ...], ...]
+    descendants: tuple[tuple[int, ...], ...]
+    ancestors: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def from_nodes(cls, nodes: Mapping[str, ResolvedNode]) -> FlowTopology:
+        index = {id: idx for idx, id in enumerate(nodes)}
+        successors: list[list[int]] = [[] for _ in index]
+        predecessors: list[list[int]] = [[] for _ in index]
+
+        for id, node in nodes.items():
+            for t in node.triggers:
+                if isinstance(t, After):
+                    for predecessor_id in t.after:
+                        successors[index[predecessor_id]].append(index[id])
+                        predecessors[index[id]].append(index[predecessor_id])
+
+        return FlowTopology(
+            index=index,
+            nodes=tuple(nodes.values()),
+            successors=tuple(map(tuple, successors)),
+            predecessors=tuple(map(tuple, predecessors)),
+            descendants=tuple(_walk(successors, idx) for idx in index.values()),
+            ancestors=tuple(_walk(predecessors, idx) for idx in index.values()),
+        )
+
+
+def _walk(adjacency: list[list[int]], start: int) -> tuple[int, ...]:
+    seen: set[int] = set()
+    queue = deque(adjacency[start])
+    while queue:
+        idx = queue.popleft()
+        if idx not in seen:
+            seen.add(idx)
+            queue.extend(adjacency[idx])
+    return tuple(sorted(seen))
+
+
 class ResolvedFlow(Model):
     nodes: dict[ID, ResolvedNode]
     args: Annotated[
@@ -236,6 +295,10 @@ class ResolvedFlow(Model):
 
         return graph
 
+    @cached_property
+    def topology(self) -> FlowTopology:
+        return FlowTopology.from_nodes(self.nodes)
+
     def mermaid(self) -> str:
         lines = ["flowchart TD"]
 
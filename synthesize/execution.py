@@ -17,6 +17,11 @@ from synthesize.messages import ExecutionCompleted, ExecutionOutput, ExecutionSt
 def write_script(node: ResolvedNode, args: Args, tmp_dir: Path) -> Path:
     path = tmp_dir / f"{node.id}-{node.uid}"
 
+    # the script only depends on the node and the flow's args, which are fixed for a run,
+    # so restarts can reuse the script written for the node's first execution
+    if path.exists():
+        return path
+
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
         node.target.render(
@@ -72,7 +77,7 @@ class Execution:
             | {
                 "SYNTH_NODE_ID": node.id,
             },
-            preexec_fn=os.setsid,
+            start_new_session=True,
         )
 
         reader = create_task(
@@ -5,6 +5,11 @@ from typing import ClassVar, Type, TypeVar
 import yaml
 from pydantic import BaseModel, ConfigDict
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: never runs
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 C = TypeVar("C", bound="Model")
 
 
@@ -18,4 +23,4 @@ class Model(BaseModel):
 
     @classmethod
     def model_validate_yaml(cls: Type[C], y: str) -> C:
-        return cls.model_validate(yaml.safe_load(y))
+        return cls.model_validate(yaml.load(y, Loader=SafeLoader))
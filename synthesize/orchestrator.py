@@ -78,14 +78,14 @@ class Orchestrator:
                     self.state.mark_running(node)
 
                 case ExecutionCompleted(node=node, exit_code=exit_code):
-                    if self.state.statuses[node.id] is not Status.Pending:
+                    if self.state.status(node) is not Status.Pending:
                         for t in node.triggers:
                             if isinstance(t, Restart):
-                                if self.state.statuses[node.id] is not Status.Waiting:
+                                if self.state.status(node) is not Status.Waiting:
                                     self.state.mark(node, status=Status.Waiting)
 
                                     def waiting_to_pending() -> None:
-                                        if self.state.statuses[node.id] is Status.Waiting:
+                                        if self.state.status(node) is Status.Waiting:
                                             self.state.mark_pending(node)
 
                                     get_running_loop().call_later(t.delay, waiting_to_pending)
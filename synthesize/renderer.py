@@ -78,7 +78,7 @@ class Renderer:
             if nodes_with_status:
                 node_status_displays.append(
                     Text.assemble(
-                        status.value.capitalize(),
+                        status.name,
                         " ",
                         Text(" ").join(
                             Text(t.id, style=Style(color="black", bgcolor=t.color))
@@ -1,58 +1,51 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Collection, Iterator, Mapping
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
-from networkx import DiGraph, ancestors, descendants
+from synthesize.config import FlowTopology, ResolvedFlow, ResolvedNode
 
-from synthesize.config import After, ResolvedFlow, ResolvedNode
 
-
-@dataclass(frozen=True)
+@dataclass
 class FlowState:
-    graph: DiGraph
     flow: ResolvedFlow
-    statuses: dict[str, Status]
+    topology: FlowTopology
+
+    statuses: list[Status]
+    blockers: list[int]
+    ready: set[int]
+    succeeded: int = 0
 
     @classmethod
     def from_flow(cls, flow: ResolvedFlow) -> FlowState:
-        graph = DiGraph()
+        # the topology is cached on the flow, so only the mutable state is built here
+        topology = flow.topology
 
-        for id, node in flow.nodes.items():
-            graph.add_node(id)
-            for t in node.triggers:
-                if isinstance(t, After):
-                    for predecessor_id in t.after:
-                        graph.add_edge(predecessor_id, id)
+        # every node starts out Pending, so each ancestor of a node is blocking it
+        blockers = [len(a) for a in topology.ancestors]
 
         return FlowState(
-            graph=graph,
             flow=flow,
-            statuses={id: Status.Pending for id in graph.nodes},
+            topology=topology,
+            statuses=[Status.Pending] * len(blockers),
+            blockers=blockers,
+            ready={idx for idx, b in enumerate(blockers) if b == 0},
         )
 
+    def status(self, node: ResolvedNode) -> Status:
+        return self.statuses[self.topology.index[node.id]]
+
     def nodes_by_status(self) -> Mapping[Status, Collection[ResolvedNode]]:
         d = defaultdict(list)
-        for id, s in self.statuses.items():
-            d[s].append(self.flow.nodes[id])
+        for node, s in zip(self.topology.nodes, self.statuses):
+            d[s].append(node)
         return d
 
     def ready_nodes(self) -> Collection[ResolvedNode]:
-        return tuple(
-            self.flow.nodes[id]
-            for id in self.graph.nodes
-            if self.statuses[id] is Status.Pending
-            and all(
-                self.statuses[a]
-                in (
-                    Status.Succeeded,
-                    Status.Waiting,
-                )
-                for a in ancestors(self.graph, id)
-            )
-        )
+        nodes = self.topology.nodes
+        return tuple(nodes[idx] for idx in sorted(self.ready))
 
     def mark_success(self, *nodes: ResolvedNode) -> None:
         self.mark(*nodes, status=Status.Succeeded)
@@ -68,25 +61,52 @@ class FlowState:
 
     def mark(self, *nodes: ResolvedNode, status: Status) -> None:
         for node in nodes:
-            self.statuses[node.id] = status
+            idx = self.topology.index[node.id]
+            previous = self.statuses[idx]
+            self.statuses[idx] = status
+
+            self.succeeded += (status is Status.Succeeded) - (previous is Status.Succeeded)
+
+            # a node only blocks its descendants while it is not Succeeded or Waiting,
+            # so the counts only need to change when that flips
+            was_unblocking = previous in UNBLOCKING
+            is_unblocking = status in UNBLOCKING
+            if was_unblocking is not is_unblocking:
+                delta = -1 if is_unblocking else 1
+                for d in self.topology.descendants[idx]:
+                    self.blockers[d] += delta
+                    self._update_ready(d)
+
+            self._update_ready(idx)
+
+    def _update_ready(self, idx: int) -> None:
+        if self.statuses[idx] is Status.Pending and self.blockers[idx] == 0:
+            self.ready.add(idx)
+        else:
+            self.ready.discard(idx)
 
     def children(self, node: ResolvedNode) -> Collection[ResolvedNode]:
-        return tuple(self.flow.nodes[id] for id in self.graph.successors(node.id))
+        topology = self.topology
+        return tuple(topology.nodes[idx] for idx in topology.successors[topology.index[node.id]])
 
     def descendants(self, node: ResolvedNode) -> Collection[ResolvedNode]:
-        return tuple(self.flow.nodes[id] for id in descendants(self.graph, node.id))
+        topology = self.topology
+        return tuple(topology.nodes[idx] for idx in topology.descendants[topology.index[node.id]])
 
     def all_done(self) -> bool:
-        return all(status is Status.Succeeded for status in self.statuses.values())
+        return self.succeeded == len(self.statuses)
+
+    def nodes(self) -> Collection[ResolvedNode]:
+        return self.topology.nodes
+
 
-    def nodes(self) -> Iterator[ResolvedNode]:
-        yield from self.flow.nodes.values()
+class Status(IntEnum):
+    Pending = 0
+    Waiting = 1
+    Starting = 2
+    Running = 3
+    Succeeded = 4
+    Failed = 5
 
 
-class Status(Enum):
-    Pending = "pending"
-    Waiting = "waiting"
-    Starting = "starting"
-    Running = "running"
-    Succeeded = "succeeded"
-    Failed = "failed"
+UNBLOCKING = frozenset((Status.Succeeded, Status.Waiting))
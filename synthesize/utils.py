@@ -15,5 +15,8 @@ def delay(delay: float, fn: Callable[[], Awaitable[T]], name: Optional[str] = No
     return create_task(delayed(), name=name)
 
 
-def md5(data: bytes | str) -> str:
-    return hashlib.md5(data if isinstance(data, bytes) else data.encode()).hexdigest()
+def md5(data: bytes | bytearray | memoryview | str) -> str:
+    return hashlib.md5(
+        data.encode() if isinstance(data, str) else data,
+        usedforsecurity=False,
+    ).hexdigest()
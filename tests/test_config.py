@@ -19,13 +19,17 @@ from synthesize.config import (
 )
 
 ROOT = Path(__file__).parent.parent
-EXAMPLES = [
-    *(ROOT / "docs" / "examples").iterdir(),
-    ROOT / "synth.yaml",
-]
+SH_HEADER = f"#!{shutil.which('sh')}\n"
+BASH_HEADER = f"#!{shutil.which('bash')}\n"
+EXAMPLES = sorted(
+    [
+        *(ROOT / "docs" / "examples").iterdir(),
+        ROOT / "synth.yaml",
+    ]
+)
 
 
-@pytest.mark.parametrize("example", EXAMPLES)
+@pytest.mark.parametrize("example", EXAMPLES, ids=lambda path: path.name)
 def test_can_generate_mermaid_from_examples(example: Path) -> None:
     for flow in Config.from_file(example).resolve().values():
         flow.mermaid()
@@ -66,42 +70,42 @@ def test_target_commands_dedenting(raw: str, expected: str) -> None:
         (
             Target(commands="", executable="sh"),
             Args(),
-            f"#!{shutil.which('sh')}\n",
+            SH_HEADER,
         ),
         (
             Target(commands="echo 'hello'", executable="sh"),
             Args(),
-            f"#!{shutil.which('sh')}\n\necho 'hello'",
+            SH_HEADER + "\necho 'hello'",
         ),
         (
             Target(commands="echo '{{foo}}'", executable="sh"),
             Args({"foo": "bar"}),
-            f"#!{shutil.which('sh')}\n\necho 'bar'",
+            SH_HEADER + "\necho 'bar'",
         ),
         (  # unused values are ok
             Target(commands="echo '{{foo}}'", executable="sh"),
             Args({"foo": "bar", "baz": "qux"}),
-            f"#!{shutil.which('sh')}\n\necho 'bar'",
+            SH_HEADER + "\necho 'bar'",
         ),
         (
             Target(commands="echo {{foo}} {{baz}}", executable="sh"),
             Args({"foo": "bar", "baz": "qux"}),
-            f"#!{shutil.which('sh')}\n\necho bar qux",
+            SH_HEADER + "\necho bar qux",
         ),
         (
             Target(commands="echo", executable="bash"),
             Args(),
-            f"#!{shutil.which('bash')}\n\necho",
+            BASH_HEADER + "\necho",
         ),
         (
             Target(commands="{{ 'yes' if choice else 'no' }}", executable="sh"),
             Args({"choice": True}),
-            f"#!{shutil.which('sh')}\n\nyes",
+            SH_HEADER + "\nyes",
         ),
         (
             Target(commands="{{ 'yes' if choice else 'no' }}", executable="sh"),
             Args({"choice": False}),
-            f"#!{shutil.which('sh')}\n\nno",
+            SH_HEADER + "\nno",
         ),
     ),
 )
@@ -116,14 +120,18 @@ def test_rendering_fails_for_bogus_executable() -> None:
 
 color = random_color()
 
+ECHO = Target(commands="echo")
+ONCE = Once()
+RESTART = Restart()
+
 
 @pytest.mark.parametrize(
     ("unresolved_node", "id", "targets", "triggers", "expected"),
     (
         (
             Node(
-                target=Target(commands="echo"),
-                triggers=[Once()],
+                target=ECHO,
+                triggers=[ONCE],
                 color=color,
             ),
             "foo",
@@ -131,40 +139,40 @@ color = random_color()
             {},
             ResolvedNode(
                 id="foo",
-                target=Target(commands="echo"),
-                triggers=[Once()],
+                target=ECHO,
+                triggers=[ONCE],
                 color=color,
             ),
         ),
         (
             Node(
                 target="t",
-                triggers=[Once()],
+                triggers=[ONCE],
                 color=color,
             ),
             "foo",
-            {"t": Target(commands="echo")},
+            {"t": ECHO},
             {},
             ResolvedNode(
                 id="foo",
-                target=Target(commands="echo"),
-                triggers=[Once()],
+                target=ECHO,
+                triggers=[ONCE],
                 color=color,
             ),
         ),
         (
             Node(
-                target=Target(commands="echo"),
+                target=ECHO,
                 triggers=["r"],
                 color=color,
             ),
             "foo",
             {},
-            {"r": Once()},
+            {"r": ONCE},
             ResolvedNode(
                 id="foo",
-                target=Target(commands="echo"),
-                triggers=[Once()],
+                target=ECHO,
+                triggers=[ONCE],
                 color=color,
             ),
         ),
@@ -175,12 +183,12 @@ color = random_color()
                 color=color,
             ),
             "foo",
-            {"t": Target(commands="echo")},
-            {"r": Once()},
+            {"t": ECHO},
+            {"r": ONCE},
             ResolvedNode(
                 id="foo",
-                target=Target(commands="echo"),
-                triggers=[Once()],
+                target=ECHO,
+                triggers=[ONCE],
                 color=color,
             ),
         ),
@@ -203,8 +211,8 @@ def test_resolve_flow_node(
             Flow(
                 nodes={
                     "foo": Node(
-                        target=Target(commands="echo"),
-                        triggers=[Once()],
+                        target=ECHO,
+                        triggers=[ONCE],
                         color=color,
                     )
                 }
@@ -215,8 +223,8 @@ def test_resolve_flow_node(
                 nodes={
                     "foo": ResolvedNode(
                         id="foo",
-                        target=Target(commands="echo"),
-                        triggers=[Once()],
+                        target=ECHO,
+                        triggers=[ONCE],
                         color=color,
                     )
                 }
@@ -236,16 +244,16 @@ def test_resolve_flow_node(
                 args={"baz": "qux"},
                 envs={"BAZ": "QUX"},
             ),
-            {"t": Target(commands="echo")},
-            {"r": Restart()},
+            {"t": ECHO},
+            {"r": RESTART},
             ResolvedFlow(
                 nodes={
                     "foo": ResolvedNode(
                         id="foo",
-                        target=Target(commands="echo"),
+                        target=ECHO,
                         args={"foo": "bar"},
                         envs={"FOO": "BAR"},
-                        triggers=[Restart()],
+                        triggers=[RESTART],
                         color=color,
                     )
                 },
@@ -284,18 +292,18 @@ def test_resolve_flow(
                         envs={"BAZ": "QUX"},
                     )
                 },
-                targets={"t": Target(commands="echo")},
-                triggers={"r": Restart()},
+                targets={"t": ECHO},
+                triggers={"r": RESTART},
             ),
             {
                 "flow": ResolvedFlow(
                     nodes={
                         "foo": ResolvedNode(
                             id="foo",
-                            target=Target(commands="echo"),
+                            target=ECHO,
                             args={"foo": "bar"},
                             envs={"FOO": "BAR"},
-                            triggers=[Restart()],
+                            triggers=[RESTART],
                             color=color,
                         )
                     },
@@ -1,73 +1,101 @@
 from asyncio import Queue
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import pytest
 
 from synthesize.config import Envs, ResolvedNode, Target, random_color
-from synthesize.execution import Execution
+from synthesize.execution import Execution, write_script
 from synthesize.messages import ExecutionCompleted, ExecutionOutput, ExecutionStarted, Message
 
 color = random_color()
 
+StartExecution = Callable[..., Awaitable[Execution]]
 
-async def test_execution_lifecycle(tmp_path: Path) -> None:
+
+@pytest.fixture
+def start_execution(tmp_path: Path) -> StartExecution:
+    async def start(node: ResolvedNode, envs: Envs | None = None, width: int = 80) -> Execution:
+        return await Execution.start(
+            node=node,
+            args={},
+            envs=envs or Envs(),
+            tmp_dir=tmp_path,
+            width=width,
+            events=Queue(),
+        )
+
+    return start
+
+
+def drain(ex: Execution) -> list[Message]:
+    # everything the execution has emitted so far is already queued,
+    # and once wait() has returned that is every message it will emit
+    messages = []
+    while not ex.events.empty():
+        messages.append(ex.events.get_nowait())
+    return messages
+
+
+def test_script_is_reused_once_written(tmp_path: Path) -> None:
     node = ResolvedNode(
         id="foo",
         target=Target(commands="echo 'hi'"),
         color=color,
     )
 
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs={},
-        tmp_dir=tmp_path,
-        width=80,
-        events=q,
+    path = write_script(node=node, args={}, tmp_dir=tmp_path)
+    path.write_text("marker")
+
+    assert write_script(node=node, args={}, tmp_dir=tmp_path) == path
+    assert path.read_text() == "marker"
+
+
+async def test_execution_lifecycle(start_execution: StartExecution) -> None:
+    node = ResolvedNode(
+        id="foo",
+        target=Target(commands="echo 'hi'"),
+        color=color,
     )
 
+    ex = await start_execution(node)
+
     assert await ex.wait() is ex
 
     assert ex.has_exited
 
-    msg = await q.get()
+    started, output, completed = drain(ex)
 
-    assert isinstance(msg, ExecutionStarted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
+    assert isinstance(started, ExecutionStarted)
+    assert started.node is node
+    assert started.pid == ex.pid
 
-    msg = await q.get()
+    assert isinstance(output, ExecutionOutput)
+    assert output.node is node
+    assert output.text == "hi"
 
-    assert isinstance(msg, ExecutionOutput)
-    assert msg.node is node
-    assert msg.text == "hi"
+    assert isinstance(completed, ExecutionCompleted)
+    assert completed.node is node
+    assert completed.pid == ex.pid
+    assert completed.exit_code == ex.exit_code == 0
+    assert completed.duration.total_seconds() > 0
 
-    msg = await q.get()
 
-    assert isinstance(msg, ExecutionCompleted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
-    assert msg.exit_code == ex.exit_code == 0
-    assert msg.duration.total_seconds() > 0
-
-
-async def test_termination_before_completion(tmp_path: Path) -> None:
+async def test_termination_before_completion(start_execution: StartExecution) -> None:
     node = ResolvedNode(
         id="foo",
-        target=Target(commands="sleep 10 && echo 'hi'"),
+        target=Target(commands="sleep 0.5 && echo 'hi'"),
         color=color,
     )
 
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs={},
-        tmp_dir=tmp_path,
-        width=80,
-        events=q,
-    )
+    ex = await start_execution(node)
+
+    # the process is definitely running once it has been reported as started
+    (started,) = drain(ex)
+
+    assert isinstance(started, ExecutionStarted)
+    assert started.node is node
+    assert started.pid == ex.pid
 
     ex.terminate()
 
@@ -75,36 +103,22 @@ async def test_termination_before_completion(tmp_path: Path) -> None:
 
     assert ex.has_exited
 
-    msg = await q.get()
-
-    assert isinstance(msg, ExecutionStarted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
+    (completed,) = drain(ex)
 
-    msg = await q.get()
+    assert isinstance(completed, ExecutionCompleted)
+    assert completed.node is node
+    assert completed.pid == ex.pid
+    assert completed.exit_code == ex.exit_code == -15
 
-    assert isinstance(msg, ExecutionCompleted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
-    assert msg.exit_code == ex.exit_code == -15
 
-
-async def test_termination_after_completion(tmp_path: Path) -> None:
+async def test_termination_after_completion(start_execution: StartExecution) -> None:
     node = ResolvedNode(
         id="foo",
         target=Target(commands="echo 'hi'"),
         color=color,
     )
 
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs={},
-        tmp_dir=tmp_path,
-        width=80,
-        events=q,
-    )
+    ex = await start_execution(node)
 
     assert await ex.wait() is ex
 
@@ -113,22 +127,21 @@ async def test_termination_after_completion(tmp_path: Path) -> None:
     ex.terminate()  # noop
 
 
-async def test_execution_kill(tmp_path: Path) -> None:
+async def test_execution_kill(start_execution: StartExecution) -> None:
     node = ResolvedNode(
         id="foo",
-        target=Target(commands="sleep 10 && echo 'hi'"),
+        target=Target(commands="sleep 0.5 && echo 'hi'"),
         color=color,
     )
 
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs={},
-        tmp_dir=tmp_path,
-        width=80,
-        events=q,
-    )
+    ex = await start_execution(node)
+
+    # the process is definitely running once it has been reported as started
+    (started,) = drain(ex)
+
+    assert isinstance(started, ExecutionStarted)
+    assert started.node is node
+    assert started.pid == ex.pid
 
     ex.kill()
 
@@ -136,36 +149,22 @@ async def test_execution_kill(tmp_path: Path) -> None:
 
     assert ex.has_exited
 
-    msg = await q.get()
+    (completed,) = drain(ex)
 
-    assert isinstance(msg, ExecutionStarted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
+    assert isinstance(completed, ExecutionCompleted)
+    assert completed.node is node
+    assert completed.pid == ex.pid
+    assert completed.exit_code == ex.exit_code == -9
 
-    msg = await q.get()
 
-    assert isinstance(msg, ExecutionCompleted)
-    assert msg.node is node
-    assert msg.pid == ex.pid
-    assert msg.exit_code == ex.exit_code == -9
-
-
-async def test_kill_after_completion(tmp_path: Path) -> None:
+async def test_kill_after_completion(start_execution: StartExecution) -> None:
     node = ResolvedNode(
         id="foo",
         target=Target(commands="echo 'hi'"),
         color=color,
     )
 
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs={},
-        tmp_dir=tmp_path,
-        width=80,
-        events=q,
-    )
+    ex = await start_execution(node)
 
     assert await ex.wait() is ex
 
@@ -177,32 +176,14 @@ async def test_kill_after_completion(tmp_path: Path) -> None:
 @pytest.mark.parametrize(
     ("node", "envs", "expected"),
     (
-        (
-            ResolvedNode(
-                id="foo",
-                target=Target(commands="echo $FORCE_COLOR"),
-                color=color,
-            ),
-            Envs(),
-            "1",
-        ),
-        (
+        (  # envs that are always set, checked together to avoid a process per variable
             ResolvedNode(
                 id="foo",
-                target=Target(commands="echo $COLUMNS"),
+                target=Target(commands="echo $FORCE_COLOR $COLUMNS $SYNTH_NODE_ID"),
                 color=color,
             ),
             Envs(),
-            "111",  # set in test body below
-        ),
-        (
-            ResolvedNode(
-                id="foo",
-                target=Target(commands="echo $SYNTH_NODE_ID"),
-                color=color,
-            ),
-            Envs(),
-            "foo",
+            "1 111 foo",  # COLUMNS is set in test body below
         ),
         (
             ResolvedNode(
@@ -259,25 +240,16 @@ async def test_kill_after_completion(tmp_path: Path) -> None:
     ),
 )
 async def test_envs(
-    tmp_path: Path,
+    start_execution: StartExecution,
     node: ResolvedNode,
     envs: Envs,
     expected: str,
 ) -> None:
-    q: Queue[Message] = Queue()
-    ex = await Execution.start(
-        node=node,
-        args={},
-        envs=envs,
-        tmp_dir=tmp_path,
-        width=111,
-        events=q,
-    )
+    ex = await start_execution(node, envs=envs, width=111)
 
     await ex.wait()
 
-    await q.get()
-    msg = await q.get()
+    _, output, _ = drain(ex)
 
-    assert isinstance(msg, ExecutionOutput)
-    assert msg.text == expected
+    assert isinstance(output, ExecutionOutput)
+    assert output.text == expected
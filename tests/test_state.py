@@ -0,0 +1,117 @@
+import pytest
+
+from synthesize.config import After, ResolvedFlow, ResolvedNode, Target, random_color
+from synthesize.state import FlowState, Status
+
+color = random_color()
+
+
+def make_flow(edges: dict[str, tuple[str, ...]]) -> ResolvedFlow:
+    return ResolvedFlow(
+        nodes={
+            id: ResolvedNode(
+                id=id,
+                target=Target(commands="echo"),
+                triggers=(After(after=after),) if after else (),
+                color=color,
+            )
+            for id, after in edges.items()
+        }
+    )
+
+
+DIAMOND = {
+    "A": (),
+    "B": ("A",),
+    "C": ("A",),
+    "D": ("B", "C"),
+}
+
+
+def ready_ids(state: FlowState) -> list[str]:
+    return [node.id for node in state.ready_nodes()]
+
+
+def test_initially_ready_nodes_have_no_ancestors() -> None:
+    state = FlowState.from_flow(make_flow(DIAMOND))
+
+    assert ready_ids(state) == ["A"]
+
+
+def test_success_unblocks_children() -> None:
+    flow = make_flow(DIAMOND)
+    state = FlowState.from_flow(flow)
+
+    state.mark_running(flow.nodes["A"])
+
+    assert ready_ids(state) == []
+
+    state.mark_success(flow.nodes["A"])
+
+    assert ready_ids(state) == ["B", "C"]
+
+    state.mark_success(flow.nodes["B"])
+
+    assert ready_ids(state) == ["C"]
+
+    state.mark_success(flow.nodes["C"])
+
+    assert ready_ids(state) == ["D"]
+
+
+@pytest.mark.parametrize("status", (Status.Pending, Status.Running, Status.Failed))
+def test_ancestor_that_is_not_done_blocks_all_descendants(status: Status) -> None:
+    flow = make_flow(DIAMOND)
+    state = FlowState.from_flow(flow)
+
+    state.mark_success(*flow.nodes.values())
+    state.mark_pending(flow.nodes["D"])
+
+    assert ready_ids(state) == ["D"]
+
+    # A is not a direct predecessor of D, but it still blocks it
+    state.mark(flow.nodes["A"], status=status)
+
+    assert "D" not in ready_ids(state)
+
+
+def test_waiting_ancestor_does_not_block() -> None:
+    flow = make_flow(DIAMOND)
+    state = FlowState.from_flow(flow)
+
+    state.mark(flow.nodes["A"], status=Status.Waiting)
+
+    assert ready_ids(state) == ["B", "C"]
+
+
+def test_all_done() -> None:
+    flow = make_flow(DIAMOND)
+    state = FlowState.from_flow(flow)
+
+    assert not state.all_done()
+
+    state.mark_success(*flow.nodes.values())
+
+    assert state.all_done()
+
+    # re-marking a node with the same status doesn't change the count
+    state.mark_success(flow.nodes["A"])
+
+    assert state.all_done()
+
+    state.mark_pending(flow.nodes["B"])
+
+    assert not state.all_done()
+
+
+def test_states_from_the_same_flow_share_topology_but_not_statuses() -> None:
+    flow = make_flow(DIAMOND)
+    first = FlowState.from_flow(flow)
+    second = FlowState.from_flow(flow)
+
+    assert first.topology is second.topology
+
+    first.mark_success(flow.nodes["A"])
+
+    assert ready_ids(first) == ["B", "C"]
+    assert ready_ids(second) == ["A"]
@@ -21,7 +21,10 @@ async def test_delay() -> None:
     (
         (b"", "d41d8cd98f00b204e9800998ecf8427e"),
         (b"hello", "5d41402abc4b2a76b9719d911017c592"),
+        ("hello", "5d41402abc4b2a76b9719d911017c592"),
+        (bytearray(b"hello"), "5d41402abc4b2a76b9719d911017c592"),
+        (memoryview(b"hello"), "5d41402abc4b2a76b9719d911017c592"),
     ),
 )
-def test_md5(data: bytes, expected: str) -> None:
+def test_md5(data: bytes | bytearray | memoryview | str, expected: str) -> None:
     assert md5(data) == expected